@@ -40,8 +40,6 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from trcks._typing import TypeVar
-from trcks.fp.composition import compose2
-from trcks.fp.monads import identity as i
 
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
@@ -112,7 +110,11 @@ def map_(f: Callable[[_T1], _T2]) -> Callable[[Awaitable[_T1]], Awaitable[_T2]]:
         'Length: 13'
 
     """
-    return map_to_awaitable(compose2((f, construct)))
+
+    async def mapped_f(awaitable: Awaitable[_T1]) -> _T2:
+        return f(await awaitable)
+
+    return mapped_f
 
 
 def map_to_awaitable(
@@ -187,7 +189,13 @@ def tap(f: Callable[[_T1], object]) -> Callable[[Awaitable[_T1]], Awaitable[_T1]
         >>> value
         'Hello, world!'
     """
-    return map_(i.tap(f))
+
+    async def mapped_f(awaitable: Awaitable[_T1]) -> _T1:
+        value = await awaitable
+        _ = f(value)
+        return value
+
+    return mapped_f
 
 
 def tap_to_awaitable(
@@ -227,11 +235,12 @@ def tap_to_awaitable(
         'Hello, world!'
     """
 
-    async def bypassed_f(value: _T1) -> _T1:
+    async def mapped_f(awaitable: Awaitable[_T1]) -> _T1:
+        value = await awaitable
         _ = await f(value)
         return value
 
-    return map_to_awaitable(bypassed_f)
+    return mapped_f
 
 
 async def to_coroutine(awtbl: Awaitable[_T]) -> _T:
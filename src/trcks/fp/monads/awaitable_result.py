@@ -41,7 +41,6 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from trcks._typing import Never, TypeVar, assert_type
-from trcks.fp.composition import compose2
 from trcks.fp.monads import awaitable as a
 from trcks.fp.monads import result as r
 
@@ -262,9 +261,20 @@ def map_failure_to_awaitable(
         >>> asyncio.run(ar.to_coroutine_result(a_rslt_2))
         ('success', 25.0)
     """
-    return map_failure_to_awaitable_result(
-        compose2((f, construct_failure_from_awaitable))
-    )
+
+    async def mapped_f(a_rslt: AwaitableResult[_F1, _S1]) -> Result[_F2, _S1]:
+        rslt = await a_rslt
+        match rslt:
+            case ("failure", value):
+                return "failure", await f(value)
+            case ("success", _):
+                return rslt
+            case _:  # pragma: no cover
+                assert_type(rslt, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
+                msg = f"{type(rslt).__name__!r} is not a valid Result"
+                raise TypeError(msg)
+
+    return mapped_f
 
 
 def map_failure_to_awaitable_result(
@@ -309,7 +319,8 @@ def map_failure_to_awaitable_result(
         ('success', 25.0)
     """
 
-    async def partially_mapped_f(rslt: Result[_F1, _S1]) -> Result[_F2, _S1 | _S2]:
+    async def mapped_f(a_rslt: AwaitableResult[_F1, _S1]) -> Result[_F2, _S1 | _S2]:
+        rslt = await a_rslt
         match rslt:
             case ("failure", value):
                 return await f(value)
@@ -320,7 +331,7 @@ def map_failure_to_awaitable_result(
                 msg = f"{type(rslt).__name__!r} is not a valid Result"
                 raise TypeError(msg)
 
-    return a.map_to_awaitable(partially_mapped_f)
+    return mapped_f
 
 
 def map_failure_to_result(
@@ -445,9 +456,20 @@ def map_success_to_awaitable(
         >>> asyncio.run(ar.to_coroutine_result(a_rslt_2))
         ('success', 43)
     """
-    return map_success_to_awaitable_result(
-        compose2((f, construct_success_from_awaitable))
-    )
+
+    async def mapped_f(a_rslt: AwaitableResult[_F1, _S1]) -> Result[_F1, _S2]:
+        rslt = await a_rslt
+        match rslt:
+            case ("failure", _):
+                return rslt
+            case ("success", value):
+                return "success", await f(value)
+            case _:  # pragma: no cover
+                assert_type(rslt, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
+                msg = f"{type(rslt).__name__!r} is not a valid Result"
+                raise TypeError(msg)
+
+    return mapped_f
 
 
 def map_success_to_awaitable_result(
@@ -493,7 +515,8 @@ def map_success_to_awaitable_result(
         ('success', 5.0)
     """
 
-    async def partially_mapped_f(rslt: Result[_F1, _S1]) -> Result[_F1 | _F2, _S2]:
+    async def mapped_f(a_rslt: AwaitableResult[_F1, _S1]) -> Result[_F1 | _F2, _S2]:
+        rslt = await a_rslt
         match rslt:
             case ("failure", _):
                 return rslt
@@ -504,7 +527,7 @@ def map_success_to_awaitable_result(
                 msg = f"{type(rslt).__name__!r} is not a valid Result"
                 raise TypeError(msg)
 
-    return a.map_to_awaitable(partially_mapped_f)
+    return mapped_f
 
 
 def map_success_to_result(
@@ -587,11 +610,20 @@ def tap_failure_to_awaitable(
             Passes on [trcks.AwaitableSuccess][] values without side effects.
     """
 
-    async def bypassed_f(value: _F1) -> _F1:
-        _ = await f(value)
-        return value
+    async def mapped_f(a_rslt: AwaitableResult[_F1, _S1]) -> Result[_F1, _S1]:
+        rslt = await a_rslt
+        match rslt:
+            case ("failure", value):
+                _ = await f(value)
+                return rslt
+            case ("success", _):
+                return rslt
+            case _:  # pragma: no cover
+                assert_type(rslt, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
+                msg = f"{type(rslt).__name__!r} is not a valid Result"
+                raise TypeError(msg)
 
-    return map_failure_to_awaitable(bypassed_f)
+    return mapped_f
 
 
 def tap_failure_to_awaitable_result(
@@ -614,18 +646,27 @@ def tap_failure_to_awaitable_result(
             Passes on [trcks.AwaitableSuccess][] values without side effects.
     """
 
-    async def bypassed_f(value: _F1) -> Result[_F1, _S2]:
-        match await f(value):
-            case ("failure", _):
-                return r.construct_failure(value)
-            case ("success", _) as rslt:
+    async def mapped_f(a_rslt: AwaitableResult[_F1, _S1]) -> Result[_F1, _S1 | _S2]:
+        rslt = await a_rslt
+        match rslt:
+            case ("failure", value):
+                match await f(value):
+                    case ("failure", _):
+                        return rslt
+                    case ("success", _) as output_rslt:
+                        return output_rslt
+                    case _ as output_rslt:  # pragma: no cover
+                        assert_type(output_rslt, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
+                        msg = f"{type(output_rslt).__name__!r} is not a valid Result"
+                        raise TypeError(msg)
+            case ("success", _):
                 return rslt
-            case _ as rslt:  # pragma: no cover
+            case _:  # pragma: no cover
                 assert_type(rslt, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
                 msg = f"{type(rslt).__name__!r} is not a valid Result"
                 raise TypeError(msg)
 
-    return map_failure_to_awaitable_result(bypassed_f)
+    return mapped_f
 
 
 def tap_failure_to_result(
@@ -686,11 +727,20 @@ def tap_success_to_awaitable(
             returns the original [trcks.AwaitableSuccess][] value.
     """
 
-    async def bypassed_f(value: _S1) -> _S1:
-        _ = await f(value)
-        return value
+    async def mapped_f(a_rslt: AwaitableResult[_F1, _S1]) -> Result[_F1, _S1]:
+        rslt = await a_rslt
+        match rslt:
+            case ("failure", _):
+                return rslt
+            case ("success", value):
+                _ = await f(value)
+                return rslt
+            case _:  # pragma: no cover
+                assert_type(rslt, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
+                msg = f"{type(rslt).__name__!r} is not a valid Result"
+                raise TypeError(msg)
 
-    return map_success_to_awaitable(bypassed_f)
+    return mapped_f
 
 
 def tap_success_to_awaitable_result(
@@ -713,18 +763,27 @@ def tap_success_to_awaitable_result(
             *the original* [trcks.AwaitableSuccess][] value is returned.
     """
 
-    async def bypassed_f(value: _S1) -> Result[_F2, _S1]:
-        match await f(value):
-            case ("failure", _) as rslt:
+    async def mapped_f(a_rslt: AwaitableResult[_F1, _S1]) -> Result[_F1 | _F2, _S1]:
+        rslt = await a_rslt
+        match rslt:
+            case ("failure", _):
                 return rslt
-            case ("success", _):
-                return r.construct_success(value)
-            case _ as rslt:  # pragma: no cover
+            case ("success", value):
+                match await f(value):
+                    case ("failure", _) as output_rslt:
+                        return output_rslt
+                    case ("success", _):
+                        return rslt
+                    case _ as output_rslt:  # pragma: no cover
+                        assert_type(output_rslt, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
+                        msg = f"{type(output_rslt).__name__!r} is not a valid Result"
+                        raise TypeError(msg)
+            case _:  # pragma: no cover
                 assert_type(rslt, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
                 msg = f"{type(rslt).__name__!r} is not a valid Result"
                 raise TypeError(msg)
 
-    return map_success_to_awaitable_result(bypassed_f)
+    return mapped_f
 
 
 def tap_success_to_result(
@@ -1892,7 +1892,7 @@ def tap_successes_to_awaitable_result_iterable(
             case ("failure", _) as r_it:
                 return r_it
             case ("success", objs):
-                return "success", tuple(s1 for _ in objs)
+                return "success", (s1,) * len(tuple(objs))
             case _ as r_it:  # pragma: no cover
                 assert_type(r_it, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
                 msg = f"{type(r_it).__name__!r} is not a valid ResultIterable"
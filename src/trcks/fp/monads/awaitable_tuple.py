@@ -57,7 +57,6 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from trcks._typing import TypeVar, deprecated
-from trcks.fp.composition import compose2
 from trcks.fp.monads import awaitable as a
 from trcks.fp.monads import tuple_ as t
 
@@ -246,7 +245,14 @@ def map_to_awaitable(
         >>> asyncio.run(at.to_coroutine_tuple(a_tpl))
         (2, 3)
     """
-    return map_to_awaitable_iterable(compose2((f, construct_from_awaitable)))
+
+    async def mapped_f(a_t1s: AwaitableTuple[_T1]) -> tuple[_T2, ...]:
+        # `tuple` does not support asynchronous generators.
+        # Therefore, we need to use a list comprehension and then convert it to a tuple:
+        t2s = [await f(t1) for t1 in await a_t1s]
+        return tuple(t2s)
+
+    return mapped_f
 
 
 def map_to_awaitable_iterable(
@@ -478,7 +484,7 @@ def tap_to_awaitable_iterable(
 
     async def bypassed_f(t1: _T1) -> tuple[_T1, ...]:
         objs = await f(t1)
-        return tuple(t1 for _ in objs)
+        return (t1,) * len(tuple(objs))
 
     return map_to_awaitable_iterable(bypassed_f)
 
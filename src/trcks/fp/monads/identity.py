@@ -3,8 +3,12 @@
 Provides utilities for functional composition of synchronous functions.
 """
 
-from collections.abc import Callable
-from typing import TypeVar
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 __docformat__ = "google"
 
@@ -75,8 +75,6 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from trcks._typing import Never, TypeVar, assert_type
-from trcks.fp.composition import compose2
-from trcks.fp.monads import identity as i
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -151,7 +149,19 @@ def map_failure(
         >>> add_prefix_to_failure(("success", 25.0))
         ('success', 25.0)
     """
-    return map_failure_to_result(compose2((f, construct_failure)))
+
+    def mapped_f(rslt: Result[_F1, _S1]) -> Result[_F2, _S1]:
+        match rslt:
+            case ("failure", value):
+                return "failure", f(value)
+            case ("success", _):
+                return rslt
+            case _:  # pragma: no cover
+                assert_type(rslt, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
+                msg = f"{type(rslt).__name__!r} is not a valid Result"
+                raise TypeError(msg)
+
+    return mapped_f
 
 
 def map_failure_to_result(
@@ -223,7 +233,19 @@ def map_success(
         >>> increase_success(("success", 42))
         ('success', 43)
     """
-    return map_success_to_result(compose2((f, construct_success)))
+
+    def mapped_f(rslt: Result[_F1, _S1]) -> Result[_F1, _S2]:
+        match rslt:
+            case ("failure", _):
+                return rslt
+            case ("success", value):
+                return "success", f(value)
+            case _:  # pragma: no cover
+                assert_type(rslt, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
+                msg = f"{type(rslt).__name__!r} is not a valid Result"
+                raise TypeError(msg)
+
+    return mapped_f
 
 
 def map_success_to_result(
@@ -289,7 +311,20 @@ def tap_failure(
             returns the original [trcks.Failure][] value.
             Passes on [trcks.Success][] values without side effects.
     """
-    return map_failure(i.tap(f))
+
+    def mapped_f(rslt: Result[_F1, _S1]) -> Result[_F1, _S1]:
+        match rslt:
+            case ("failure", value):
+                _ = f(value)
+                return rslt
+            case ("success", _):
+                return rslt
+            case _:  # pragma: no cover
+                assert_type(rslt, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
+                msg = f"{type(rslt).__name__!r} is not a valid Result"
+                raise TypeError(msg)
+
+    return mapped_f
 
 
 def tap_failure_to_result(
@@ -312,18 +347,26 @@ def tap_failure_to_result(
             Passes on [trcks.Success][] values without side effects.
     """
 
-    def bypassed_f(value: _F1) -> Result[_F1, _S2]:
-        match f(value):
-            case ("failure", _):
-                return construct_failure(value)
-            case ("success", _) as rslt:
+    def mapped_f(rslt: Result[_F1, _S1]) -> Result[_F1, _S1 | _S2]:
+        match rslt:
+            case ("failure", value):
+                match f(value):
+                    case ("success", _) as output_rslt:
+                        return output_rslt
+                    case ("failure", _):
+                        return rslt
+                    case _ as output_rslt:  # pragma: no cover
+                        assert_type(output_rslt, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
+                        msg = f"{type(output_rslt).__name__!r} is not a valid Result"
+                        raise TypeError(msg)
+            case ("success", _):
                 return rslt
-            case _ as rslt:  # pragma: no cover
+            case _:  # pragma: no cover
                 assert_type(rslt, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
                 msg = f"{type(rslt).__name__!r} is not a valid Result"
                 raise TypeError(msg)
 
-    return map_failure_to_result(bypassed_f)
+    return mapped_f
 
 
 def tap_success(
@@ -341,7 +384,20 @@ def tap_success(
             Applies the given side effect to [trcks.Success][] values and
             returns the original [trcks.Success][] value.
     """
-    return map_success(i.tap(f))
+
+    def mapped_f(rslt: Result[_F1, _S1]) -> Result[_F1, _S1]:
+        match rslt:
+            case ("failure", _):
+                return rslt
+            case ("success", value):
+                _ = f(value)
+                return rslt
+            case _:  # pragma: no cover
+                assert_type(rslt, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
+                msg = f"{type(rslt).__name__!r} is not a valid Result"
+                raise TypeError(msg)
+
+    return mapped_f
 
 
 def tap_success_to_result(
@@ -364,15 +420,23 @@ def tap_success_to_result(
             *the original* [trcks.Success][] value is returned.
     """
 
-    def bypassed_f(value: _S1) -> Result[_F2, _S1]:
-        match f(value):
-            case ("failure", _) as rslt:
+    def mapped_f(rslt: Result[_F1, _S1]) -> Result[_F1 | _F2, _S1]:
+        match rslt:
+            case ("failure", _):
                 return rslt
-            case ("success", _):
-                return construct_success(value)
-            case _ as rslt:  # pragma: no cover
+            case ("success", value):
+                match f(value):
+                    case ("failure", _) as output_rslt:
+                        return output_rslt
+                    case ("success", _):
+                        return rslt
+                    case _ as output_rslt:  # pragma: no cover
+                        assert_type(output_rslt, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
+                        msg = f"{type(output_rslt).__name__!r} is not a valid Result"
+                        raise TypeError(msg)
+            case _:  # pragma: no cover
                 assert_type(rslt, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
                 msg = f"{type(rslt).__name__!r} is not a valid Result"
                 raise TypeError(msg)
 
-    return map_success_to_result(bypassed_f)
+    return mapped_f
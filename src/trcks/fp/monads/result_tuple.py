@@ -607,7 +607,7 @@ def tap_failure_to_iterable(
     """
 
     def tapped_f(f1: _F1) -> tuple[_F1, ...]:
-        return tuple(f1 for _s2 in f(f1))
+        return (f1,) * len(tuple(f(f1)))
 
     return map_failure_to_iterable(tapped_f)
 
@@ -877,7 +877,7 @@ def tap_successes_to_result_iterable(
             case ("failure", _) as r_it:
                 return r_it
             case ("success", s2s):
-                return "success", tuple(s1 for _ in s2s)
+                return "success", (s1,) * len(tuple(s2s))
             case _ as r_it:  # pragma: no cover
                 assert_type(r_it, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
                 msg = f"{type(r_it).__name__!r} is not a valid ResultIterable"
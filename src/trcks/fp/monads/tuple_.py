@@ -53,8 +53,6 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from trcks._typing import TypeVar, deprecated
-from trcks.fp.composition import compose2
-from trcks.fp.monads import identity as i
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterable
@@ -110,7 +108,11 @@ def map_(f: Callable[[_T1], _T2]) -> Callable[[tuple[_T1, ...]], tuple[_T2, ...]
         >>> double_integers((1, 2, 3))
         (2, 4, 6)
     """
-    return map_to_iterable(compose2((f, construct)))
+
+    def mapped_f(t1s: tuple[_T1, ...]) -> tuple[_T2, ...]:
+        return tuple(map(f, t1s))
+
+    return mapped_f
 
 
 def map_to_iterable(
@@ -140,7 +142,10 @@ def map_to_iterable(
     """
 
     def mapped_f(t1s: tuple[_T1, ...]) -> tuple[_T2, ...]:
-        return tuple(t2 for t1 in t1s for t2 in f(t1))
+        t2s: list[_T2] = []
+        for t1 in t1s:
+            t2s.extend(f(t1))
+        return tuple(t2s)
 
     return mapped_f
 
@@ -182,7 +187,13 @@ def tap(
         >>> tpl
         (1, 2, 3)
     """
-    return map_(i.tap(f))
+
+    def tapped_f(t1s: tuple[_T1, ...]) -> tuple[_T1, ...]:
+        for t1 in t1s:
+            _ = f(t1)
+        return t1s
+
+    return tapped_f
 
 
 def tap_to_iterable(
@@ -214,7 +225,7 @@ def tap_to_iterable(
     """
 
     def bypassed_f(t1: _T1) -> tuple[_T1, ...]:
-        return tuple(t1 for _t2 in f(t1))
+        return (t1,) * len(tuple(f(t1)))
 
     return map_to_iterable(bypassed_f)
 
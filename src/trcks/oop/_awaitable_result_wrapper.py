@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, final
 from trcks import Result
 from trcks._typing import Never, TypeVar, deprecated
 from trcks.fp.monads import awaitable_result as ar
+from trcks.fp.monads import awaitable_result_tuple as art
 from trcks.oop._awaitable_result_tuple_wrapper import AwaitableResultTupleWrapper
 from trcks.oop._base_awaitable_wrapper import BaseAwaitableWrapper
 
@@ -445,9 +446,11 @@ class AwaitableResultWrapper(
             >>> asyncio.run(wrapper_2.core_as_coroutine)
             ('success', (25.0,))
         """
-        return AwaitableResultTupleWrapper.construct_from_awaitable_result(
-            self.core
-        ).map_failure_to_awaitable_result_iterable(f)
+        return AwaitableResultTupleWrapper(
+            art.map_failure_to_awaitable_result_iterable(f)(
+                art.construct_from_awaitable_result(self.core)
+            )
+        )
 
     @deprecated("Use map_failure_to_awaitable_result_iterable instead")
     def map_failure_to_awaitable_result_tuple(
@@ -507,9 +510,11 @@ class AwaitableResultWrapper(
             >>> asyncio.run(wrapper_2.core_as_coroutine)
             ('success', (25.0,))
         """
-        return AwaitableResultTupleWrapper.construct_from_awaitable_result(
-            self.core
-        ).map_failure_to_iterable(f)
+        return AwaitableResultTupleWrapper(
+            art.map_failure_to_iterable(f)(
+                art.construct_from_awaitable_result(self.core)
+            )
+        )
 
     def map_failure_to_result(
         self, f: Callable[[_F_default_co], Result[_F, _S]]
@@ -617,9 +622,11 @@ class AwaitableResultWrapper(
             >>> asyncio.run(wrapper_2.core_as_coroutine)
             ('success', (25.0,))
         """
-        return AwaitableResultTupleWrapper.construct_from_awaitable_result(
-            self.core
-        ).map_failure_to_result_iterable(f)
+        return AwaitableResultTupleWrapper(
+            art.map_failure_to_result_iterable(f)(
+                art.construct_from_awaitable_result(self.core)
+            )
+        )
 
     @deprecated("Use map_failure_to_result_iterable instead")
     def map_failure_to_result_tuple(
@@ -839,9 +846,11 @@ class AwaitableResultWrapper(
             >>> asyncio.run(wrapper_2.core_as_coroutine)
             ('success', (5.0, 10.0))
         """
-        return AwaitableResultTupleWrapper.construct_from_awaitable_result(
-            self.core
-        ).map_successes_to_awaitable_result_iterable(f)
+        return AwaitableResultTupleWrapper(
+            art.map_successes_to_awaitable_result_iterable(f)(
+                art.construct_from_awaitable_result(self.core)
+            )
+        )
 
     @deprecated("Use map_success_to_awaitable_result_iterable instead")
     def map_success_to_awaitable_result_tuple(
@@ -898,9 +907,11 @@ class AwaitableResultWrapper(
             >>> asyncio.run(wrapper_2.core_as_coroutine)
             ('success', (5.0, 5.0))
         """
-        return AwaitableResultTupleWrapper.construct_from_awaitable_result(
-            self.core
-        ).map_successes_to_iterable(f)
+        return AwaitableResultTupleWrapper(
+            art.map_successes_to_iterable(f)(
+                art.construct_from_awaitable_result(self.core)
+            )
+        )
 
     def map_success_to_result(
         self, f: Callable[[_S_default_co], Result[_F, _S]]
@@ -1009,9 +1020,11 @@ class AwaitableResultWrapper(
             >>> asyncio.run(wrapper_2.core_as_coroutine)
             ('success', (5.0, 10.0))
         """
-        return AwaitableResultTupleWrapper.construct_from_awaitable_result(
-            self.core
-        ).map_successes_to_result_iterable(f)
+        return AwaitableResultTupleWrapper(
+            art.map_successes_to_result_iterable(f)(
+                art.construct_from_awaitable_result(self.core)
+            )
+        )
 
     @deprecated("Use map_success_to_result_iterable instead")
     def map_success_to_result_tuple(
@@ -1186,9 +1199,11 @@ class AwaitableResultWrapper(
             >>> asyncio.run(wrapper_2.core_as_coroutine)
             ('success', (42,))
         """
-        return AwaitableResultTupleWrapper.construct_from_awaitable_result(
-            self.core
-        ).tap_failure_to_awaitable_result_iterable(f)
+        return AwaitableResultTupleWrapper(
+            art.tap_failure_to_awaitable_result_iterable(f)(
+                art.construct_from_awaitable_result(self.core)
+            )
+        )
 
     @deprecated("Use tap_failure_to_awaitable_result_iterable instead")
     def tap_failure_to_awaitable_result_tuple(
@@ -1253,9 +1268,11 @@ class AwaitableResultWrapper(
             >>> asyncio.run(wrapper_2.core_as_coroutine)
             ('success', (42,))
         """
-        return AwaitableResultTupleWrapper.construct_from_awaitable_result(
-            self.core
-        ).tap_failure_to_iterable(f)
+        return AwaitableResultTupleWrapper(
+            art.tap_failure_to_iterable(f)(
+                art.construct_from_awaitable_result(self.core)
+            )
+        )
 
     def tap_failure_to_result(
         self, f: Callable[[_F_default_co], Result[object, _S]]
@@ -1368,9 +1385,11 @@ class AwaitableResultWrapper(
             >>> asyncio.run(wrapper_2.core_as_coroutine)
             ('success', (42,))
         """
-        return AwaitableResultTupleWrapper.construct_from_awaitable_result(
-            self.core
-        ).tap_failure_to_result_iterable(f)
+        return AwaitableResultTupleWrapper(
+            art.tap_failure_to_result_iterable(f)(
+                art.construct_from_awaitable_result(self.core)
+            )
+        )
 
     @deprecated("Use tap_failure_to_result_iterable instead")
     def tap_failure_to_result_tuple(
@@ -1599,9 +1618,11 @@ class AwaitableResultWrapper(
             >>> result_2
             ('success', ('Hello, world!', 'Hello, world!'))
         """
-        return AwaitableResultTupleWrapper.construct_from_awaitable_result(
-            self.core
-        ).tap_successes_to_awaitable_result_iterable(f)
+        return AwaitableResultTupleWrapper(
+            art.tap_successes_to_awaitable_result_iterable(f)(
+                art.construct_from_awaitable_result(self.core)
+            )
+        )
 
     @deprecated("Use tap_success_to_awaitable_result_iterable instead")
     def tap_success_to_awaitable_result_tuple(
@@ -1666,9 +1687,11 @@ class AwaitableResultWrapper(
             >>> result_2
             ('success', (7, 7))
         """
-        return AwaitableResultTupleWrapper.construct_from_awaitable_result(
-            self.core
-        ).tap_successes_to_iterable(f)
+        return AwaitableResultTupleWrapper(
+            art.tap_successes_to_iterable(f)(
+                art.construct_from_awaitable_result(self.core)
+            )
+        )
 
     def tap_success_to_result(
         self, f: Callable[[_S_default_co], Result[_F, object]]
@@ -1742,9 +1765,11 @@ class AwaitableResultWrapper(
             >>> asyncio.run(wrapper_2.core_as_coroutine)
             ('success', ('Hello, world!', 'Hello, world!'))
         """
-        return AwaitableResultTupleWrapper.construct_from_awaitable_result(
-            self.core
-        ).tap_successes_to_result_iterable(f)
+        return AwaitableResultTupleWrapper(
+            art.tap_successes_to_result_iterable(f)(
+                art.construct_from_awaitable_result(self.core)
+            )
+        )
 
     @deprecated("Use tap_success_to_result_iterable instead")
     def tap_success_to_result_tuple(
@@ -4,7 +4,13 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, final
 
 from trcks._typing import TypeVar, deprecated
+from trcks.fp.composition import compose2
 from trcks.fp.monads import awaitable as a
+from trcks.fp.monads import awaitable_result as ar
+from trcks.fp.monads import awaitable_result_tuple as art
+from trcks.fp.monads import awaitable_tuple as at
+from trcks.fp.monads import result_tuple as rt
+from trcks.fp.monads import tuple_ as t
 from trcks.oop._awaitable_result_tuple_wrapper import AwaitableResultTupleWrapper
 from trcks.oop._awaitable_result_wrapper import AwaitableResultWrapper
 from trcks.oop._awaitable_tuple_wrapper import AwaitableTupleWrapper
@@ -256,9 +262,7 @@ class AwaitableWrapper(BaseAwaitableWrapper[_T_co]):
             >>> asyncio.run(awaitable_result_wrapper.core_as_coroutine)
             ('success', 42.0)
         """
-        return AwaitableResultWrapper.construct_success_from_awaitable(
-            self.core
-        ).map_success_to_awaitable_result(f)
+        return AwaitableResultWrapper(a.map_to_awaitable(f)(self.core))
 
     def map_to_awaitable_result_iterable(
         self, f: Callable[[_T_co], AwaitableResultIterable[_F, _S]]
@@ -296,9 +300,9 @@ class AwaitableWrapper(BaseAwaitableWrapper[_T_co]):
             >>> asyncio.run(wrapper.core_as_coroutine)
             ('success', (5.0, 10.0))
         """
-        return AwaitableResultTupleWrapper.construct_successes_from_awaitable(
-            self.core
-        ).map_successes_to_awaitable_result_iterable(f)
+        return AwaitableResultTupleWrapper(
+            a.map_(rt.construct_from_result_iterable)(a.map_to_awaitable(f)(self.core))
+        )
 
     @deprecated("Use map_to_awaitable_result_iterable instead")
     def map_to_awaitable_result_tuple(
@@ -376,9 +380,7 @@ class AwaitableWrapper(BaseAwaitableWrapper[_T_co]):
             >>> asyncio.run(awaitable_result_wrapper.core_as_coroutine)
             ('failure', 'negative value')
         """
-        return AwaitableResultWrapper.construct_success_from_awaitable(
-            self.core
-        ).map_success_to_result(f)
+        return AwaitableResultWrapper(a.map_(f)(self.core))
 
     def map_to_result_iterable(
         self, f: Callable[[_T_co], ResultIterable[_F, _S]]
@@ -410,9 +412,9 @@ class AwaitableWrapper(BaseAwaitableWrapper[_T_co]):
             >>> asyncio.run(wrapper.core_as_coroutine)
             ('success', (5.0, 10.0))
         """
-        return AwaitableResultTupleWrapper.construct_successes_from_awaitable(
-            self.core
-        ).map_successes_to_result_iterable(f)
+        return AwaitableResultTupleWrapper(
+            a.map_(compose2((f, rt.construct_from_result_iterable)))(self.core)
+        )
 
     @deprecated("Use map_to_result_iterable instead")
     def map_to_result_tuple(
@@ -519,9 +521,9 @@ class AwaitableWrapper(BaseAwaitableWrapper[_T_co]):
             Processing: 21
             (21, 21)
         """
-        return AwaitableTupleWrapper.construct_from_awaitable(
-            self.core
-        ).tap_to_awaitable_iterable(f)
+        return AwaitableTupleWrapper(
+            at.tap_to_awaitable_iterable(f)(at.construct_from_awaitable(self.core))
+        )
 
     def tap_to_awaitable_result(
         self, f: Callable[[_T_co], AwaitableResult[_F, object]]
@@ -569,9 +571,11 @@ class AwaitableWrapper(BaseAwaitableWrapper[_T_co]):
             >>> result_2
             ('success', 'Hello, world!')
         """
-        return AwaitableResultWrapper.construct_success_from_awaitable(
-            self.core
-        ).tap_success_to_awaitable_result(f)
+        return AwaitableResultWrapper(
+            ar.tap_success_to_awaitable_result(f)(
+                ar.construct_success_from_awaitable(self.core)
+            )
+        )
 
     def tap_to_awaitable_result_iterable(
         self, f: Callable[[_T_co], AwaitableResultIterable[_F, object]]
@@ -613,9 +617,11 @@ class AwaitableWrapper(BaseAwaitableWrapper[_T_co]):
             >>> result
             ('success', ('Hello, world!', 'Hello, world!'))
         """
-        return AwaitableResultTupleWrapper.construct_successes_from_awaitable(
-            self.core
-        ).tap_successes_to_awaitable_result_iterable(f)
+        return AwaitableResultTupleWrapper(
+            art.tap_successes_to_awaitable_result_iterable(f)(
+                art.construct_successes_from_awaitable(self.core)
+            )
+        )
 
     @deprecated("Use tap_to_awaitable_result_iterable instead")
     def tap_to_awaitable_result_tuple(
@@ -668,9 +674,9 @@ class AwaitableWrapper(BaseAwaitableWrapper[_T_co]):
             Processing: 42
             (42, 42)
         """
-        return AwaitableTupleWrapper.construct_from_awaitable(
-            self.core
-        ).tap_to_iterable(f)
+        return AwaitableTupleWrapper(
+            a.map_(compose2((t.construct, t.tap_to_iterable(f))))(self.core)
+        )
 
     def tap_to_result(
         self, f: Callable[[_T_co], Result[_F, object]]
@@ -713,9 +719,9 @@ class AwaitableWrapper(BaseAwaitableWrapper[_T_co]):
             >>> result_2
             ('success', 3.5)
         """
-        return AwaitableResultWrapper.construct_success_from_awaitable(
-            self.core
-        ).tap_success_to_result(f)
+        return AwaitableResultWrapper(
+            ar.tap_success_to_result(f)(ar.construct_success_from_awaitable(self.core))
+        )
 
     def tap_to_result_iterable(
         self, f: Callable[[_T_co], ResultIterable[_F, object]]
@@ -753,9 +759,13 @@ class AwaitableWrapper(BaseAwaitableWrapper[_T_co]):
             >>> result
             ('success', ('Hello, world!', 'Hello, world!'))
         """
-        return AwaitableResultTupleWrapper.construct_successes_from_awaitable(
-            self.core
-        ).tap_successes_to_result_iterable(f)
+        return AwaitableResultTupleWrapper(
+            a.map_(
+                compose2(
+                    (rt.construct_successes, rt.tap_successes_to_result_iterable(f))
+                )
+            )(self.core)
+        )
 
     @deprecated("Use tap_to_result_iterable instead")
     def tap_to_result_tuple(
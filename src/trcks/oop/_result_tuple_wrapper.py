@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, final
 
 from trcks import ResultTuple
-from trcks._typing import Never, TypeVar, deprecated
+from trcks._typing import Never, TypeVar, assert_type, deprecated
 from trcks.fp.monads import result_tuple as rt
 from trcks.oop._awaitable_result_tuple_wrapper import AwaitableResultTupleWrapper
 from trcks.oop._base_wrapper import BaseWrapper
@@ -1002,7 +1002,7 @@ class ResultTupleWrapper(BaseWrapper[ResultTuple[_F_default_co, _S_default_co]])
             f: The synchronous side effect to be applied.
 
         Returns:
-            A new [trcks.oop.ResultTupleWrapper][] instance
+            A [trcks.oop.ResultTupleWrapper][] instance
                 with the original [trcks.ResultTuple][] object,
                 allowing for further method chaining.
 
@@ -1025,7 +1025,8 @@ class ResultTupleWrapper(BaseWrapper[ResultTuple[_F_default_co, _S_default_co]])
             >>> result_tuple_wrapper_2
             ResultTupleWrapper(core=('success', (1,)))
         """
-        return ResultTupleWrapper(rt.tap_failure(f)(self.core))
+        _ = rt.tap_failure(f)(self.core)
+        return self
 
     def tap_failure_to_awaitable(
         self, f: Callable[[_F_default_co], Awaitable[object]]
@@ -1320,7 +1321,7 @@ class ResultTupleWrapper(BaseWrapper[ResultTuple[_F_default_co, _S_default_co]])
             f: The synchronous side effect to be applied.
 
         Returns:
-            A new [trcks.oop.ResultTupleWrapper][] instance with
+            A [trcks.oop.ResultTupleWrapper][] instance with
 
                 - *the original* [trcks.Failure][]
                     if the applied side effect returns a [trcks.Failure][],
@@ -1352,11 +1353,19 @@ class ResultTupleWrapper(BaseWrapper[ResultTuple[_F_default_co, _S_default_co]])
             ... ).tap_failure_to_result(recover)
             ResultTupleWrapper(core=('success', (1, 2)))
         """
-        tapped_f: Callable[
-            [ResultTuple[_F_default_co, _S_default_co]],
-            ResultTuple[_F_default_co, _S_default_co | _S],
-        ] = rt.tap_failure_to_result(f)
-        return ResultTupleWrapper(tapped_f(self.core))
+        match self.core:
+            case ("success", _):
+                return self
+            case ("failure", _):
+                tapped_f: Callable[
+                    [ResultTuple[_F_default_co, _S_default_co]],
+                    ResultTuple[_F_default_co, _S_default_co | _S],
+                ] = rt.tap_failure_to_result(f)
+                return ResultTupleWrapper(tapped_f(self.core))
+            case _:  # pragma: no cover
+                assert_type(self.core, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
+                msg = f"{type(self.core).__name__!r} is not a valid ResultTuple"
+                raise TypeError(msg)
 
     def tap_failure_to_result_iterable(
         self, f: Callable[[_F_default_co], ResultIterable[object, _S]]
@@ -1370,7 +1379,7 @@ class ResultTupleWrapper(BaseWrapper[ResultTuple[_F_default_co, _S_default_co]])
             f: The synchronous side effect to be applied.
 
         Returns:
-            A new [trcks.oop.ResultTupleWrapper][] instance with
+            A [trcks.oop.ResultTupleWrapper][] instance with
 
                 - *the original* [trcks.Failure][]
                     if the applied side effect returns a [trcks.Failure][],
@@ -1402,11 +1411,19 @@ class ResultTupleWrapper(BaseWrapper[ResultTuple[_F_default_co, _S_default_co]])
             ... ).tap_failure_to_result_iterable(recover)
             ResultTupleWrapper(core=('success', (1, 2)))
         """
-        tapped_f: Callable[
-            [ResultTuple[_F_default_co, _S_default_co]],
-            ResultTuple[_F_default_co, _S_default_co | _S],
-        ] = rt.tap_failure_to_result_iterable(f)
-        return ResultTupleWrapper(tapped_f(self.core))
+        match self.core:
+            case ("success", _):
+                return self
+            case ("failure", _):
+                tapped_f: Callable[
+                    [ResultTuple[_F_default_co, _S_default_co]],
+                    ResultTuple[_F_default_co, _S_default_co | _S],
+                ] = rt.tap_failure_to_result_iterable(f)
+                return ResultTupleWrapper(tapped_f(self.core))
+            case _:  # pragma: no cover
+                assert_type(self.core, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
+                msg = f"{type(self.core).__name__!r} is not a valid ResultTuple"
+                raise TypeError(msg)
 
     @deprecated("Use tap_failure_to_result_iterable instead")
     def tap_failure_to_result_tuple(
@@ -1438,7 +1455,7 @@ class ResultTupleWrapper(BaseWrapper[ResultTuple[_F_default_co, _S_default_co]])
             f: The synchronous side effect to be applied to each success element.
 
         Returns:
-            A new [trcks.oop.ResultTupleWrapper][] instance
+            A [trcks.oop.ResultTupleWrapper][] instance
                 with the original [trcks.ResultTuple][] object,
                 allowing for further method chaining.
 
@@ -1461,7 +1478,8 @@ class ResultTupleWrapper(BaseWrapper[ResultTuple[_F_default_co, _S_default_co]])
             >>> result_tuple_wrapper_2
             ResultTupleWrapper(core=('failure', 'oops'))
         """
-        return ResultTupleWrapper(rt.tap_successes(f)(self.core))
+        _ = rt.tap_successes(f)(self.core)
+        return self
 
     def tap_successes_to_awaitable(
         self, f: Callable[[_S_default_co], Awaitable[object]]
@@ -1692,7 +1710,7 @@ class ResultTupleWrapper(BaseWrapper[ResultTuple[_F_default_co, _S_default_co]])
             f: The synchronous side effect to be applied to each success element.
 
         Returns:
-            A new [trcks.oop.ResultTupleWrapper][] instance with
+            A [trcks.oop.ResultTupleWrapper][] instance with
 
                 - the original [trcks.Failure][] if no side effect was applied, or
                 - a [trcks.SuccessTuple][] where each original element is repeated
@@ -1711,7 +1729,15 @@ class ResultTupleWrapper(BaseWrapper[ResultTuple[_F_default_co, _S_default_co]])
             Received: 7
             ResultTupleWrapper(core=('success', (7, 7)))
         """
-        return ResultTupleWrapper(rt.tap_successes_to_iterable(f)(self.core))
+        match self.core:
+            case ("failure", _):
+                return self
+            case ("success", _):
+                return ResultTupleWrapper(rt.tap_successes_to_iterable(f)(self.core))
+            case _:  # pragma: no cover
+                assert_type(self.core, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
+                msg = f"{type(self.core).__name__!r} is not a valid ResultTuple"
+                raise TypeError(msg)
 
     def tap_successes_to_result(
         self, f: Callable[[_S_default_co], Result[_F, object]]
@@ -1725,7 +1751,7 @@ class ResultTupleWrapper(BaseWrapper[ResultTuple[_F_default_co, _S_default_co]])
             f: The synchronous side effect to be applied to each success element.
 
         Returns:
-            A new [trcks.oop.ResultTupleWrapper][] instance with
+            A [trcks.oop.ResultTupleWrapper][] instance with
 
                 - *the original* [trcks.Failure][] if no side effect was applied,
                 - *the returned* [trcks.Failure][]
@@ -1757,7 +1783,15 @@ class ResultTupleWrapper(BaseWrapper[ResultTuple[_F_default_co, _S_default_co]])
             ... ).tap_successes_to_result(_validate_positive)
             ResultTupleWrapper(core=('failure', 'oops'))
         """
-        return ResultTupleWrapper(rt.tap_successes_to_result(f)(self.core))
+        match self.core:
+            case ("failure", _):
+                return self
+            case ("success", _):
+                return ResultTupleWrapper(rt.tap_successes_to_result(f)(self.core))
+            case _:  # pragma: no cover
+                assert_type(self.core, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
+                msg = f"{type(self.core).__name__!r} is not a valid ResultTuple"
+                raise TypeError(msg)
 
     def tap_successes_to_result_iterable(
         self, f: Callable[[_S_default_co], ResultIterable[_F, object]]
@@ -1771,7 +1805,7 @@ class ResultTupleWrapper(BaseWrapper[ResultTuple[_F_default_co, _S_default_co]])
             f: The synchronous side effect to be applied to each success element.
 
         Returns:
-            A new [trcks.oop.ResultTupleWrapper][] instance with
+            A [trcks.oop.ResultTupleWrapper][] instance with
 
                 - *the original* [trcks.Failure][] if no side effect was applied,
                 - *the returned* [trcks.Failure][]
@@ -1798,7 +1832,17 @@ class ResultTupleWrapper(BaseWrapper[ResultTuple[_F_default_co, _S_default_co]])
             ... ).tap_successes_to_result_iterable(_validate_positive_twice)
             ResultTupleWrapper(core=('failure', 'not positive'))
         """
-        return ResultTupleWrapper(rt.tap_successes_to_result_iterable(f)(self.core))
+        match self.core:
+            case ("failure", _):
+                return self
+            case ("success", _):
+                return ResultTupleWrapper(
+                    rt.tap_successes_to_result_iterable(f)(self.core)
+                )
+            case _:  # pragma: no cover
+                assert_type(self.core, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
+                msg = f"{type(self.core).__name__!r} is not a valid ResultTuple"
+                raise TypeError(msg)
 
     @deprecated("Use tap_successes_to_result_iterable instead")
     def tap_successes_to_result_tuple(
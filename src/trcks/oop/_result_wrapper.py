@@ -4,8 +4,11 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, final
 
 from trcks import Result
-from trcks._typing import Never, TypeVar, deprecated
+from trcks._typing import Never, TypeVar, assert_type, deprecated
+from trcks.fp.monads import awaitable_result as ar
+from trcks.fp.monads import awaitable_result_tuple as art
 from trcks.fp.monads import result as r
+from trcks.fp.monads import result_tuple as rt
 from trcks.oop._awaitable_result_tuple_wrapper import AwaitableResultTupleWrapper
 from trcks.oop._awaitable_result_wrapper import AwaitableResultWrapper
 from trcks.oop._base_wrapper import BaseWrapper
@@ -192,9 +195,17 @@ class ResultWrapper(BaseWrapper[Result[_F_default_co, _S_default_co]]):
             >>> asyncio.run(awaitable_result_wrapper_2.core_as_coroutine)
             ('success', 42)
         """
-        return AwaitableResultWrapper.construct_from_result(
-            self.core
-        ).map_failure_to_awaitable(f)
+        match self.core:
+            case ("success", _) as success:
+                return AwaitableResultWrapper.construct_from_result(success)
+            case ("failure", _) as failure:
+                return AwaitableResultWrapper(
+                    ar.map_failure_to_awaitable(f)(ar.construct_from_result(failure))
+                )
+            case _:  # pragma: no cover
+                assert_type(self.core, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
+                msg = f"{type(self.core).__name__!r} is not a valid Result"
+                raise TypeError(msg)
 
     def map_failure_to_awaitable_result(
         self, f: Callable[[_F_default_co], AwaitableResult[_F, _S]]
@@ -254,9 +265,19 @@ class ResultWrapper(BaseWrapper[Result[_F_default_co, _S_default_co]]):
             >>> asyncio.run(awaitable_result_wrapper_3.core_as_coroutine)
             ('success', 25.0)
         """
-        return AwaitableResultWrapper.construct_from_result(
-            self.core
-        ).map_failure_to_awaitable_result(f)
+        match self.core:
+            case ("success", _) as success:
+                return AwaitableResultWrapper.construct_from_result(success)
+            case ("failure", _) as failure:
+                return AwaitableResultWrapper(
+                    ar.map_failure_to_awaitable_result(f)(
+                        ar.construct_from_result(failure)
+                    )
+                )
+            case _:  # pragma: no cover
+                assert_type(self.core, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
+                msg = f"{type(self.core).__name__!r} is not a valid Result"
+                raise TypeError(msg)
 
     def map_failure_to_awaitable_result_iterable(
         self, f: Callable[[_F_default_co], AwaitableResultIterable[_F, _S]]
@@ -308,9 +329,19 @@ class ResultWrapper(BaseWrapper[Result[_F_default_co, _S_default_co]]):
             >>> asyncio.run(wrapper_2.core_as_coroutine)
             ('success', (25.0,))
         """
-        return AwaitableResultTupleWrapper.construct_from_result(
-            self.core
-        ).map_failure_to_awaitable_result_iterable(f)
+        match self.core:
+            case ("success", _) as success:
+                return AwaitableResultTupleWrapper.construct_from_result(success)
+            case ("failure", value):
+                return AwaitableResultTupleWrapper(
+                    art.map_failure_to_awaitable_result_iterable(f)(
+                        art.construct_failure(value)
+                    )
+                )
+            case _:  # pragma: no cover
+                assert_type(self.core, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
+                msg = f"{type(self.core).__name__!r} is not a valid Result"
+                raise TypeError(msg)
 
     @deprecated("Use map_failure_to_awaitable_result_iterable instead")
     def map_failure_to_awaitable_result_tuple(
@@ -365,9 +396,15 @@ class ResultWrapper(BaseWrapper[Result[_F_default_co, _S_default_co]]):
             ... ).map_failure_to_iterable(recover)
             ResultTupleWrapper(core=('success', (42,)))
         """
-        return ResultTupleWrapper.construct_from_result(
-            self.core
-        ).map_failure_to_iterable(f)
+        match self.core:
+            case ("success", _) as success:
+                return ResultTupleWrapper.construct_from_result(success)
+            case ("failure", _) as failure:
+                return ResultTupleWrapper(rt.map_failure_to_iterable(f)(failure))
+            case _:  # pragma: no cover
+                assert_type(self.core, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
+                msg = f"{type(self.core).__name__!r} is not a valid Result"
+                raise TypeError(msg)
 
     def map_failure_to_result(
         self, f: Callable[[_F_default_co], Result[_F, _S]]
@@ -460,9 +497,15 @@ class ResultWrapper(BaseWrapper[Result[_F_default_co, _S_default_co]]):
             ... ).map_failure_to_result_iterable(expand_error)
             ResultTupleWrapper(core=('success', (42,)))
         """
-        return ResultTupleWrapper.construct_from_result(
-            self.core
-        ).map_failure_to_result_iterable(f)
+        match self.core:
+            case ("success", _) as success:
+                return ResultTupleWrapper.construct_from_result(success)
+            case ("failure", _) as failure:
+                return ResultTupleWrapper(rt.map_failure_to_result_iterable(f)(failure))
+            case _:  # pragma: no cover
+                assert_type(self.core, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
+                msg = f"{type(self.core).__name__!r} is not a valid Result"
+                raise TypeError(msg)
 
     @deprecated("Use map_failure_to_result_iterable instead")
     def map_failure_to_result_tuple(
@@ -550,9 +593,17 @@ class ResultWrapper(BaseWrapper[Result[_F_default_co, _S_default_co]]):
             >>> asyncio.run(awaitable_result_wrapper_2.core_as_coroutine)
             ('success', 43)
         """
-        return AwaitableResultWrapper.construct_from_result(
-            self.core
-        ).map_success_to_awaitable(f)
+        match self.core:
+            case ("failure", _) as failure:
+                return AwaitableResultWrapper.construct_from_result(failure)
+            case ("success", _) as success:
+                return AwaitableResultWrapper(
+                    ar.map_success_to_awaitable(f)(ar.construct_from_result(success))
+                )
+            case _:  # pragma: no cover
+                assert_type(self.core, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
+                msg = f"{type(self.core).__name__!r} is not a valid Result"
+                raise TypeError(msg)
 
     def map_success_to_awaitable_result(
         self, f: Callable[[_S_default_co], AwaitableResult[_F, _S]]
@@ -613,9 +664,19 @@ class ResultWrapper(BaseWrapper[Result[_F_default_co, _S_default_co]]):
             >>> asyncio.run(awaitable_result_wrapper_3.core_as_coroutine)
             ('success', 5.0)
         """
-        return AwaitableResultWrapper.construct_from_result(
-            self.core
-        ).map_success_to_awaitable_result(f)
+        match self.core:
+            case ("failure", _) as failure:
+                return AwaitableResultWrapper.construct_from_result(failure)
+            case ("success", _) as success:
+                return AwaitableResultWrapper(
+                    ar.map_success_to_awaitable_result(f)(
+                        ar.construct_from_result(success)
+                    )
+                )
+            case _:  # pragma: no cover
+                assert_type(self.core, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
+                msg = f"{type(self.core).__name__!r} is not a valid Result"
+                raise TypeError(msg)
 
     def map_success_to_awaitable_result_iterable(
         self, f: Callable[[_S_default_co], AwaitableResultIterable[_F, _S]]
@@ -667,9 +728,19 @@ class ResultWrapper(BaseWrapper[Result[_F_default_co, _S_default_co]]):
             >>> asyncio.run(wrapper_2.core_as_coroutine)
             ('success', (5.0, 10.0))
         """
-        return AwaitableResultTupleWrapper.construct_from_result(
-            self.core
-        ).map_successes_to_awaitable_result_iterable(f)
+        match self.core:
+            case ("failure", _) as failure:
+                return AwaitableResultTupleWrapper.construct_from_result(failure)
+            case ("success", value):
+                return AwaitableResultTupleWrapper(
+                    art.map_successes_to_awaitable_result_iterable(f)(
+                        art.construct_successes(value)
+                    )
+                )
+            case _:  # pragma: no cover
+                assert_type(self.core, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
+                msg = f"{type(self.core).__name__!r} is not a valid Result"
+                raise TypeError(msg)
 
     @deprecated("Use map_success_to_awaitable_result_iterable instead")
     def map_success_to_awaitable_result_tuple(
@@ -715,9 +786,17 @@ class ResultWrapper(BaseWrapper[Result[_F_default_co, _S_default_co]]):
             ... ).map_success_to_iterable(duplicate)
             ResultTupleWrapper(core=('success', (5.0, 5.0)))
         """
-        return ResultTupleWrapper.construct_from_result(
-            self.core
-        ).map_successes_to_iterable(f)
+        match self.core:
+            case ("failure", _) as failure:
+                return ResultTupleWrapper.construct_from_result(failure)
+            case ("success", value):
+                return ResultTupleWrapper(
+                    rt.map_successes_to_iterable(f)(rt.construct_successes(value))
+                )
+            case _:  # pragma: no cover
+                assert_type(self.core, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
+                msg = f"{type(self.core).__name__!r} is not a valid Result"
+                raise TypeError(msg)
 
     def map_success_to_result(
         self, f: Callable[[_S_default_co], Result[_F, _S]]
@@ -804,9 +883,19 @@ class ResultWrapper(BaseWrapper[Result[_F_default_co, _S_default_co]]):
             ... ).map_success_to_result_iterable(expand)
             ResultTupleWrapper(core=('failure', 'negative'))
         """
-        return ResultTupleWrapper.construct_from_result(
-            self.core
-        ).map_successes_to_result_iterable(f)
+        match self.core:
+            case ("failure", _) as failure:
+                return ResultTupleWrapper.construct_from_result(failure)
+            case ("success", value):
+                return ResultTupleWrapper(
+                    rt.map_successes_to_result_iterable(f)(
+                        rt.construct_successes(value)
+                    )
+                )
+            case _:  # pragma: no cover
+                assert_type(self.core, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
+                msg = f"{type(self.core).__name__!r} is not a valid Result"
+                raise TypeError(msg)
 
     @deprecated("Use map_success_to_result_iterable instead")
     def map_success_to_result_tuple(
@@ -835,7 +924,7 @@ class ResultWrapper(BaseWrapper[Result[_F_default_co, _S_default_co]]):
             f: The synchronous side effect to be applied.
 
         Returns:
-            A new [trcks.oop.ResultWrapper][] instance
+            A [trcks.oop.ResultWrapper][] instance
                 with the original [trcks.Result][] object,
                 allowing for further method chaining.
 
@@ -852,7 +941,8 @@ class ResultWrapper(BaseWrapper[Result[_F_default_co, _S_default_co]]):
             >>> result_wrapper_2
             ResultWrapper(core=('success', 42))
         """
-        return ResultWrapper(r.tap_failure(f)(self.core))
+        _ = r.tap_failure(f)(self.core)
+        return self
 
     def tap_failure_to_awaitable(
         self, f: Callable[[_F_default_co], Awaitable[object]]
@@ -894,9 +984,17 @@ class ResultWrapper(BaseWrapper[Result[_F_default_co, _S_default_co]]):
             >>> result_2
             ('success', 42)
         """
-        return AwaitableResultWrapper.construct_from_result(
-            self.core
-        ).tap_failure_to_awaitable(f)
+        match self.core:
+            case ("success", _) as success:
+                return AwaitableResultWrapper.construct_from_result(success)
+            case ("failure", _) as failure:
+                return AwaitableResultWrapper(
+                    ar.tap_failure_to_awaitable(f)(ar.construct_from_result(failure))
+                )
+            case _:  # pragma: no cover
+                assert_type(self.core, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
+                msg = f"{type(self.core).__name__!r} is not a valid Result"
+                raise TypeError(msg)
 
     def tap_failure_to_awaitable_result(
         self, f: Callable[[_F_default_co], AwaitableResult[object, _S]]
@@ -955,9 +1053,19 @@ class ResultWrapper(BaseWrapper[Result[_F_default_co, _S_default_co]]):
             >>> result_3
             ('success', 42)
         """
-        return AwaitableResultWrapper.construct_from_result(
-            self.core
-        ).tap_failure_to_awaitable_result(f)
+        match self.core:
+            case ("success", _) as success:
+                return AwaitableResultWrapper.construct_from_result(success)
+            case ("failure", _) as failure:
+                return AwaitableResultWrapper(
+                    ar.tap_failure_to_awaitable_result(f)(
+                        ar.construct_from_result(failure)
+                    )
+                )
+            case _:  # pragma: no cover
+                assert_type(self.core, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
+                msg = f"{type(self.core).__name__!r} is not a valid Result"
+                raise TypeError(msg)
 
     def tap_failure_to_awaitable_result_iterable(
         self, f: Callable[[_F_default_co], AwaitableResultIterable[object, _S]]
@@ -1012,9 +1120,19 @@ class ResultWrapper(BaseWrapper[Result[_F_default_co, _S_default_co]]):
             >>> asyncio.run(wrapper_2.core_as_coroutine)
             ('success', (42,))
         """
-        return AwaitableResultTupleWrapper.construct_from_result(
-            self.core
-        ).tap_failure_to_awaitable_result_iterable(f)
+        match self.core:
+            case ("success", _) as success:
+                return AwaitableResultTupleWrapper.construct_from_result(success)
+            case ("failure", value):
+                return AwaitableResultTupleWrapper(
+                    art.tap_failure_to_awaitable_result_iterable(f)(
+                        art.construct_failure(value)
+                    )
+                )
+            case _:  # pragma: no cover
+                assert_type(self.core, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
+                msg = f"{type(self.core).__name__!r} is not a valid Result"
+                raise TypeError(msg)
 
     @deprecated("Use tap_failure_to_awaitable_result_iterable instead")
     def tap_failure_to_awaitable_result_tuple(
@@ -1070,9 +1188,15 @@ class ResultWrapper(BaseWrapper[Result[_F_default_co, _S_default_co]]):
             ... ).tap_failure_to_iterable(log_err)
             ResultTupleWrapper(core=('success', (42,)))
         """
-        return ResultTupleWrapper.construct_from_result(
-            self.core
-        ).tap_failure_to_iterable(f)
+        match self.core:
+            case ("success", _) as success:
+                return ResultTupleWrapper.construct_from_result(success)
+            case ("failure", _) as failure:
+                return ResultTupleWrapper(rt.tap_failure_to_iterable(f)(failure))
+            case _:  # pragma: no cover
+                assert_type(self.core, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
+                msg = f"{type(self.core).__name__!r} is not a valid Result"
+                raise TypeError(msg)
 
     def tap_failure_to_result(
         self, f: Callable[[_F_default_co], Result[object, _S]]
@@ -1086,7 +1210,7 @@ class ResultWrapper(BaseWrapper[Result[_F_default_co, _S_default_co]]):
             f: The synchronous side effect to be applied.
 
         Returns:
-            A new [trcks.oop.ResultWrapper][] instance with
+            A [trcks.oop.ResultWrapper][] instance with
 
                 - *the original* [trcks.Failure][]
                     if the applied side effect returns a [trcks.Failure][],
@@ -1118,7 +1242,10 @@ class ResultWrapper(BaseWrapper[Result[_F_default_co, _S_default_co]]):
             >>> result_wrapper_3
             ResultWrapper(core=('success', 42))
         """
-        return ResultWrapper(r.tap_failure_to_result(f)(self.core))
+        rslt = r.tap_failure_to_result(f)(self.core)
+        if rslt is self.core:
+            return self
+        return ResultWrapper(rslt)
 
     def tap_failure_to_result_iterable(
         self, f: Callable[[_F_default_co], ResultIterable[object, _S]]
@@ -1164,9 +1291,15 @@ class ResultWrapper(BaseWrapper[Result[_F_default_co, _S_default_co]]):
             ... ).tap_failure_to_result_iterable(attempt_recover)
             ResultTupleWrapper(core=('success', (42,)))
         """
-        return ResultTupleWrapper.construct_from_result(
-            self.core
-        ).tap_failure_to_result_iterable(f)
+        match self.core:
+            case ("success", _) as success:
+                return ResultTupleWrapper.construct_from_result(success)
+            case ("failure", _) as failure:
+                return ResultTupleWrapper(rt.tap_failure_to_result_iterable(f)(failure))
+            case _:  # pragma: no cover
+                assert_type(self.core, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
+                msg = f"{type(self.core).__name__!r} is not a valid Result"
+                raise TypeError(msg)
 
     @deprecated("Use tap_failure_to_result_iterable instead")
     def tap_failure_to_result_tuple(
@@ -1195,7 +1328,7 @@ class ResultWrapper(BaseWrapper[Result[_F_default_co, _S_default_co]]):
             f: The synchronous side effect to be applied.
 
         Returns:
-            A new [trcks.oop.ResultWrapper][] instance
+            A [trcks.oop.ResultWrapper][] instance
                 with the original [trcks.Result][] object,
                 allowing for further method chaining.
 
@@ -1212,7 +1345,8 @@ class ResultWrapper(BaseWrapper[Result[_F_default_co, _S_default_co]]):
             >>> result_wrapper_2
             ResultWrapper(core=('success', 42))
         """
-        return ResultWrapper(r.tap_success(f)(self.core))
+        _ = r.tap_success(f)(self.core)
+        return self
 
     def tap_success_to_awaitable(
         self, f: Callable[[_S_default_co], Awaitable[object]]
@@ -1254,9 +1388,17 @@ class ResultWrapper(BaseWrapper[Result[_F_default_co, _S_default_co]]):
             >>> result_2
             ('success', 'Hello, world!')
         """
-        return AwaitableResultWrapper.construct_from_result(
-            self.core
-        ).tap_success_to_awaitable(f)
+        match self.core:
+            case ("failure", _) as failure:
+                return AwaitableResultWrapper.construct_from_result(failure)
+            case ("success", _) as success:
+                return AwaitableResultWrapper(
+                    ar.tap_success_to_awaitable(f)(ar.construct_from_result(success))
+                )
+            case _:  # pragma: no cover
+                assert_type(self.core, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
+                msg = f"{type(self.core).__name__!r} is not a valid Result"
+                raise TypeError(msg)
 
     def tap_success_to_awaitable_result(
         self, f: Callable[[_S_default_co], AwaitableResult[_F, object]]
@@ -1331,9 +1473,19 @@ class ResultWrapper(BaseWrapper[Result[_F_default_co, _S_default_co]]):
             >>> result_4
             ('success', 'Hello, world!')
         """
-        return AwaitableResultWrapper.construct_from_result(
-            self.core
-        ).tap_success_to_awaitable_result(f)
+        match self.core:
+            case ("failure", _) as failure:
+                return AwaitableResultWrapper.construct_from_result(failure)
+            case ("success", _) as success:
+                return AwaitableResultWrapper(
+                    ar.tap_success_to_awaitable_result(f)(
+                        ar.construct_from_result(success)
+                    )
+                )
+            case _:  # pragma: no cover
+                assert_type(self.core, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
+                msg = f"{type(self.core).__name__!r} is not a valid Result"
+                raise TypeError(msg)
 
     def tap_success_to_awaitable_result_iterable(
         self, f: Callable[[_S_default_co], AwaitableResultIterable[_F, object]]
@@ -1389,9 +1541,19 @@ class ResultWrapper(BaseWrapper[Result[_F_default_co, _S_default_co]]):
             >>> result_2
             ('success', ('Hello, world!', 'Hello, world!'))
         """
-        return AwaitableResultTupleWrapper.construct_from_result(
-            self.core
-        ).tap_successes_to_awaitable_result_iterable(f)
+        match self.core:
+            case ("failure", _) as failure:
+                return AwaitableResultTupleWrapper.construct_from_result(failure)
+            case ("success", value):
+                return AwaitableResultTupleWrapper(
+                    art.tap_successes_to_awaitable_result_iterable(f)(
+                        art.construct_successes(value)
+                    )
+                )
+            case _:  # pragma: no cover
+                assert_type(self.core, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
+                msg = f"{type(self.core).__name__!r} is not a valid Result"
+                raise TypeError(msg)
 
     @deprecated("Use tap_success_to_awaitable_result_iterable instead")
     def tap_success_to_awaitable_result_tuple(
@@ -1444,9 +1606,17 @@ class ResultWrapper(BaseWrapper[Result[_F_default_co, _S_default_co]]):
             v=7
             ResultTupleWrapper(core=('success', (7, 7)))
         """
-        return ResultTupleWrapper.construct_from_result(
-            self.core
-        ).tap_successes_to_iterable(f)
+        match self.core:
+            case ("failure", _) as failure:
+                return ResultTupleWrapper.construct_from_result(failure)
+            case ("success", value):
+                return ResultTupleWrapper(
+                    rt.tap_successes_to_iterable(f)(rt.construct_successes(value))
+                )
+            case _:  # pragma: no cover
+                assert_type(self.core, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
+                msg = f"{type(self.core).__name__!r} is not a valid Result"
+                raise TypeError(msg)
 
     def tap_success_to_result(
         self, f: Callable[[_S_default_co], Result[_F, object]]
@@ -1460,7 +1630,7 @@ class ResultWrapper(BaseWrapper[Result[_F_default_co, _S_default_co]]):
             f: The synchronous side effect to be applied.
 
         Returns:
-            A new [trcks.oop.ResultWrapper][] instance with
+            A [trcks.oop.ResultWrapper][] instance with
 
                 - *the original* [trcks.Failure][] if no side effect was applied,
                 - *the returned* [trcks.Failure][]
@@ -1468,7 +1638,10 @@ class ResultWrapper(BaseWrapper[Result[_F_default_co, _S_default_co]]):
                 - *the original* [trcks.Success][]
                     if the applied side effect returns a [trcks.Success][].
         """
-        return ResultWrapper(r.tap_success_to_result(f)(self.core))
+        rslt = r.tap_success_to_result(f)(self.core)
+        if rslt is self.core:
+            return self
+        return ResultWrapper(rslt)
 
     def tap_success_to_result_iterable(
         self, f: Callable[[_S_default_co], ResultIterable[_F, object]]
@@ -1514,9 +1687,19 @@ class ResultWrapper(BaseWrapper[Result[_F_default_co, _S_default_co]]):
             ... ).tap_success_to_result_iterable(audit)
             ResultTupleWrapper(core=('failure', 'negative'))
         """
-        return ResultTupleWrapper.construct_from_result(
-            self.core
-        ).tap_successes_to_result_iterable(f)
+        match self.core:
+            case ("failure", _) as failure:
+                return ResultTupleWrapper.construct_from_result(failure)
+            case ("success", value):
+                return ResultTupleWrapper(
+                    rt.tap_successes_to_result_iterable(f)(
+                        rt.construct_successes(value)
+                    )
+                )
+            case _:  # pragma: no cover
+                assert_type(self.core, Never)  # type: ignore[unreachable]  # pyright: ignore[reportUnreachable]
+                msg = f"{type(self.core).__name__!r} is not a valid Result"
+                raise TypeError(msg)
 
     @deprecated("Use tap_success_to_result_iterable instead")
     def tap_success_to_result_tuple(
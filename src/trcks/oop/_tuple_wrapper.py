@@ -475,8 +475,9 @@ class TupleWrapper(BaseWrapper[tuple[_T_co, ...]]):
             f: The synchronous side effect to be applied to each element.
 
         Returns:
-            A new [trcks.oop.TupleWrapper][] instance with
-                the original homogeneous [tuple][].
+            A [trcks.oop.TupleWrapper][] instance with
+                the original homogeneous [tuple][],
+                allowing for further method chaining.
 
         Example:
             >>> from trcks.oop import TupleWrapper
@@ -494,7 +495,8 @@ class TupleWrapper(BaseWrapper[tuple[_T_co, ...]]):
             >>> tuple_wrapper
             TupleWrapper(core=(1, 2, 3))
         """
-        return TupleWrapper(t.tap(f)(self.core))
+        _ = t.tap(f)(self.core)
+        return self
 
     def tap_to_awaitable(
         self, f: Callable[[_T_co], Awaitable[object]]
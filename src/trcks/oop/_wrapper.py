@@ -83,7 +83,7 @@ class Wrapper(BaseWrapper[_T_co]):
             >>> Wrapper.construct(5)
             Wrapper(core=5)
         """
-        return Wrapper(core=value)
+        return Wrapper(value)
 
     def map(self, f: Callable[[_T_co], _T]) -> Wrapper[_T]:
         """Apply a synchronous function to the wrapped object.
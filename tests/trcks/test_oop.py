@@ -1,12 +1,19 @@
 import asyncio
 import math
-from collections.abc import Callable, Coroutine
+from collections.abc import Awaitable, Callable, Coroutine
 from typing import Final, Literal
 
 import pytest
 
 from trcks import Result
-from trcks.oop import AwaitableResultWrapper, AwaitableWrapper, ResultWrapper, Wrapper
+from trcks.oop import (
+    AwaitableResultWrapper,
+    AwaitableWrapper,
+    ResultTupleWrapper,
+    ResultWrapper,
+    TupleWrapper,
+    Wrapper,
+)
 
 _TO_PAIR: Final[Callable[[int], tuple[int, int]]] = lambda n: (n, n)  # noqa: E731
 
@@ -51,6 +58,21 @@ async def _get_square_root_safely_and_slowly(
     return "success", math.sqrt(x)
 
 
+def _get_square_roots_safely(
+    x: float,
+) -> Result[Literal["negative"], tuple[float, float]]:
+    if x < 0:
+        return "failure", "negative"
+    return "success", (math.sqrt(x), -math.sqrt(x))
+
+
+async def _get_square_roots_safely_and_slowly(
+    x: float,
+) -> Result[Literal["negative"], tuple[float, float]]:
+    await asyncio.sleep(0.001)
+    return _get_square_roots_safely(x)
+
+
 async def _stringify_slowly(o: object) -> str:
     await asyncio.sleep(0.001)
     return str(o)
@@ -102,6 +124,46 @@ class TestAwaitableWrapper:
             _get_square_root_safely
         ).core == _get_square_root_safely(value)
 
+    @pytest.mark.parametrize("value", _FLOATS)
+    async def test_map_to_awaitable_result_iterable_maps_value(
+        self, value: float
+    ) -> None:
+        assert await AwaitableWrapper.construct(value).map_to_awaitable_result_iterable(
+            _get_square_roots_safely_and_slowly
+        ).core == await _get_square_roots_safely_and_slowly(value)
+
+    @pytest.mark.parametrize("value", _FLOATS)
+    async def test_map_to_result_iterable_maps_value(self, value: float) -> None:
+        assert await AwaitableWrapper.construct(value).map_to_result_iterable(
+            _get_square_roots_safely
+        ).core == _get_square_roots_safely(value)
+
+    @pytest.mark.parametrize("value", _FLOATS)
+    async def test_tap_to_awaitable_result_iterable_repeats_value(
+        self, value: float
+    ) -> None:
+        expected: Final = (
+            ("failure", "negative") if value < 0 else ("success", (value, value))
+        )
+        assert (
+            await AwaitableWrapper.construct(value)
+            .tap_to_awaitable_result_iterable(_get_square_roots_safely_and_slowly)
+            .core
+            == expected
+        )
+
+    @pytest.mark.parametrize("value", _FLOATS)
+    async def test_tap_to_result_iterable_repeats_value(self, value: float) -> None:
+        expected: Final = (
+            ("failure", "negative") if value < 0 else ("success", (value, value))
+        )
+        assert (
+            await AwaitableWrapper.construct(value)
+            .tap_to_result_iterable(_get_square_roots_safely)
+            .core
+            == expected
+        )
+
 
 class TestAwaitableResultWrapper:
     @pytest.mark.parametrize("result", _RESULTS)
@@ -111,6 +173,13 @@ class TestAwaitableResultWrapper:
         awaitable_result = asyncio.create_task(asyncio.sleep(0.001, result=result))
         assert AwaitableResultWrapper(awaitable_result).core is awaitable_result
 
+    @pytest.mark.parametrize("result", _RESULTS)
+    def test_construct_from_result_core_runs_in_asyncio_run(
+        self, result: Result[str, float]
+    ) -> None:
+        core: Final = AwaitableResultWrapper.construct_from_result(result).core
+        assert asyncio.run(core) == result  # type: ignore[arg-type]
+
     @pytest.mark.parametrize("value", _OBJECTS)
     async def test_construct_failure_wraps_value(self, value: object) -> None:
         awaited_core = await AwaitableResultWrapper.construct_failure(value).core
@@ -330,6 +399,57 @@ class TestAwaitableResultWrapper:
             _get_square_root_safely
         ).core == _get_square_root_safely(value)
 
+    @pytest.mark.parametrize("value", _FLOATS)
+    async def test_tap_failure_to_awaitable_result_recovers_failure(
+        self, value: float
+    ) -> None:
+        failure: Final = ("failure", value)
+        expected: Final = (
+            failure if value < 0 else await _get_square_root_safely_and_slowly(value)
+        )
+        assert (
+            await AwaitableResultWrapper.construct_from_result(failure)
+            .tap_failure_to_awaitable_result(_get_square_root_safely_and_slowly)
+            .core
+            == expected
+        )
+
+    @pytest.mark.parametrize("value", _FLOATS)
+    async def test_tap_failure_to_awaitable_result_does_not_change_success(
+        self, value: float
+    ) -> None:
+        success: Final = ("success", value)
+        assert (
+            await AwaitableResultWrapper.construct_from_result(success)
+            .tap_failure_to_awaitable_result(_get_square_root_safely_and_slowly)
+            .core
+            is success
+        )
+
+    @pytest.mark.parametrize("value", _OBJECTS)
+    async def test_tap_success_to_awaitable_result_does_not_change_failure(
+        self, value: object
+    ) -> None:
+        failure: Final = ("failure", value)
+        assert (
+            await AwaitableResultWrapper.construct_from_result(failure)
+            .tap_success_to_awaitable_result(_get_square_root_safely_and_slowly)
+            .core
+            is failure
+        )
+
+    @pytest.mark.parametrize("value", _OBJECTS)
+    async def test_tap_success_to_result_does_not_change_failure(
+        self, value: object
+    ) -> None:
+        failure: Final = ("failure", value)
+        assert (
+            await AwaitableResultWrapper.construct_from_result(failure)
+            .tap_success_to_result(_get_square_root_safely)
+            .core
+            is failure
+        )
+
 
 class TestWrapper:
     @pytest.mark.parametrize("value", _OBJECTS)
@@ -398,6 +518,18 @@ class TestResultWrapper:
             _double(value),
         )
 
+    @pytest.mark.parametrize("result", _RESULTS)
+    def test_map_failure_to_awaitable_core_runs_in_asyncio_run(
+        self, result: Result[str, float]
+    ) -> None:
+        core: Final = (
+            ResultWrapper(result).map_failure_to_awaitable(_stringify_slowly).core
+        )
+        expected: Final = (
+            ("failure", str(result[1])) if result[0] == "failure" else result
+        )
+        assert asyncio.run(core) == expected  # type: ignore[arg-type]
+
     @pytest.mark.parametrize("value", _OBJECTS)
     async def test_map_failure_to_awaitable_does_not_change_success(
         self, value: object
@@ -441,6 +573,60 @@ class TestResultWrapper:
             _get_square_root_safely_and_slowly
         ).core == await _get_square_root_safely_and_slowly(value)
 
+    @pytest.mark.parametrize("value", _FLOATS)
+    @pytest.mark.parametrize(
+        ("construct", "method_name", "f"),
+        [
+            (
+                ResultWrapper.construct_failure,
+                "map_failure_to_awaitable",
+                _double_slowly,
+            ),
+            (
+                ResultWrapper.construct_failure,
+                "map_failure_to_awaitable_result",
+                _get_square_root_safely_and_slowly,
+            ),
+            (
+                ResultWrapper.construct_failure,
+                "map_failure_to_awaitable_result_iterable",
+                _get_square_roots_safely_and_slowly,
+            ),
+            (
+                ResultWrapper.construct_success,
+                "map_success_to_awaitable",
+                _double_slowly,
+            ),
+            (
+                ResultWrapper.construct_success,
+                "map_success_to_awaitable_result",
+                _get_square_root_safely_and_slowly,
+            ),
+            (
+                ResultWrapper.construct_success,
+                "map_success_to_awaitable_result_iterable",
+                _get_square_roots_safely_and_slowly,
+            ),
+        ],
+    )
+    async def test_map_to_awaitable_calls_f_only_when_awaited(
+        self,
+        value: float,
+        construct: Callable[[float], ResultWrapper[float, float]],
+        method_name: str,
+        f: Callable[[float], Awaitable[object]],
+    ) -> None:
+        calls: Final[list[float]] = []
+
+        def recording_f(x: float) -> Awaitable[object]:
+            calls.append(x)
+            return f(x)
+
+        core: Final = getattr(construct(value), method_name)(recording_f).core
+        assert calls == []
+        _ = await core
+        assert calls == [value]
+
     @pytest.mark.parametrize("value", _FLOATS)
     def test_map_failure_to_result_does_not_change_success(self, value: float) -> None:
         success: Final = ("success", value)
@@ -467,6 +653,18 @@ class TestResultWrapper:
             _double(value),
         )
 
+    @pytest.mark.parametrize("result", _RESULTS)
+    def test_map_success_to_awaitable_core_runs_in_asyncio_run(
+        self, result: Result[str, float]
+    ) -> None:
+        core: Final = (
+            ResultWrapper(result).map_success_to_awaitable(_double_slowly).core
+        )
+        expected: Final = (
+            ("success", _double(result[1])) if result[0] == "success" else result
+        )
+        assert asyncio.run(core) == expected  # type: ignore[arg-type]
+
     @pytest.mark.parametrize("value", _OBJECTS)
     async def test_map_success_to_awaitable_does_not_change_failure(
         self, value: object
@@ -523,3 +721,111 @@ class TestResultWrapper:
         assert ResultWrapper.construct_success(value).map_success_to_result(
             _get_square_root_safely
         ).core == _get_square_root_safely(value)
+
+    @pytest.mark.parametrize("value", _OBJECTS)
+    def test_tap_failure_returns_same_wrapper_for_success(self, value: object) -> None:
+        result_wrapper: Final = ResultWrapper.construct_success(value)
+        calls: Final[list[object]] = []
+        assert result_wrapper.tap_failure(calls.append) is result_wrapper
+        assert calls == []
+
+    @pytest.mark.parametrize("value", _OBJECTS)
+    def test_tap_success_returns_same_wrapper_for_failure(self, value: object) -> None:
+        result_wrapper: Final = ResultWrapper.construct_failure(value)
+        calls: Final[list[object]] = []
+        assert result_wrapper.tap_success(calls.append) is result_wrapper
+        assert calls == []
+
+    @pytest.mark.parametrize("value", _OBJECTS)
+    def test_tap_failure_returns_same_wrapper_for_failure(self, value: object) -> None:
+        result_wrapper: Final = ResultWrapper.construct_failure(value)
+        calls: Final[list[object]] = []
+        assert result_wrapper.tap_failure(calls.append) is result_wrapper
+        assert calls == [value]
+
+    @pytest.mark.parametrize("value", _OBJECTS)
+    def test_tap_success_returns_same_wrapper_for_success(self, value: object) -> None:
+        result_wrapper: Final = ResultWrapper.construct_success(value)
+        calls: Final[list[object]] = []
+        assert result_wrapper.tap_success(calls.append) is result_wrapper
+        assert calls == [value]
+
+    @pytest.mark.parametrize("value", _FLOATS)
+    def test_tap_failure_to_result_keeps_wrapper_unless_replaced(
+        self, value: float
+    ) -> None:
+        result_wrapper: Final = ResultWrapper.construct_failure(value)
+        tapped: Final = result_wrapper.tap_failure_to_result(_get_square_root_safely)
+        if value < 0:
+            assert tapped is result_wrapper
+        else:
+            assert tapped.core == ("success", math.sqrt(value))
+
+    @pytest.mark.parametrize("value", _FLOATS)
+    def test_tap_success_to_result_keeps_wrapper_unless_replaced(
+        self, value: float
+    ) -> None:
+        result_wrapper: Final = ResultWrapper.construct_success(value)
+        tapped: Final = result_wrapper.tap_success_to_result(_get_square_root_safely)
+        if value < 0:
+            assert tapped.core == ("failure", "negative")
+        else:
+            assert tapped is result_wrapper
+
+
+class TestResultTupleWrapper:
+    @pytest.mark.parametrize("value", _OBJECTS)
+    def test_tap_failure_returns_same_wrapper_for_failure(self, value: object) -> None:
+        result_tuple_wrapper: Final = ResultTupleWrapper.construct_failure(value)
+        calls: Final[list[object]] = []
+        assert result_tuple_wrapper.tap_failure(calls.append) is result_tuple_wrapper
+        assert calls == [value]
+
+    @pytest.mark.parametrize("value", _OBJECTS)
+    def test_tap_failure_returns_same_wrapper_for_successes(
+        self, value: object
+    ) -> None:
+        result_tuple_wrapper: Final = ResultTupleWrapper.construct_successes(value)
+        calls: Final[list[object]] = []
+        assert result_tuple_wrapper.tap_failure(calls.append) is result_tuple_wrapper
+        assert calls == []
+
+    @pytest.mark.parametrize("value", _OBJECTS)
+    def test_tap_successes_returns_same_wrapper_for_successes(
+        self, value: object
+    ) -> None:
+        result_tuple_wrapper: Final = ResultTupleWrapper.construct_successes(value)
+        calls: Final[list[object]] = []
+        assert result_tuple_wrapper.tap_successes(calls.append) is result_tuple_wrapper
+        assert calls == [value]
+
+    @pytest.mark.parametrize("value", _OBJECTS)
+    def test_tap_successes_to_iterable_returns_same_wrapper_for_failure(
+        self, value: object
+    ) -> None:
+        result_tuple_wrapper: Final = ResultTupleWrapper.construct_failure(value)
+        assert (
+            result_tuple_wrapper.tap_successes_to_iterable(_TO_PAIR)
+            is result_tuple_wrapper
+        )
+
+    @pytest.mark.parametrize("value", _OBJECTS)
+    def test_tap_successes_to_result_iterable_returns_same_wrapper_for_failure(
+        self, value: object
+    ) -> None:
+        result_tuple_wrapper: Final = ResultTupleWrapper.construct_failure(value)
+        assert (
+            result_tuple_wrapper.tap_successes_to_result_iterable(
+                _get_square_roots_safely
+            )
+            is result_tuple_wrapper
+        )
+
+
+class TestTupleWrapper:
+    @pytest.mark.parametrize("value", _OBJECTS)
+    def test_tap_returns_same_wrapper(self, value: object) -> None:
+        tuple_wrapper: Final = TupleWrapper.construct(value)
+        calls: Final[list[object]] = []
+        assert tuple_wrapper.tap(calls.append) is tuple_wrapper
+        assert calls == [value]